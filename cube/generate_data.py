@@ -1,6 +1,12 @@
 import sqlite3
+import hashlib
+import math
+import string
+import numpy as np
 import pandas as pd
 from faker import Faker
+from faker.providers.person.en_US import Provider as PersonProvider
+from faker.providers.internet.en_US import Provider as InternetProvider
 from datetime import timedelta
 import random
 
@@ -27,57 +33,127 @@ def generate_departments(n=15):
         })
     return pd.DataFrame(departments)
 
-# Generate identities data (renamed from users)
-def generate_identities(departments_df, n=200):
-    identities = []
+# Alphabetic name parts, deduplicated case-insensitively for email local parts
+def _name_pool(names):
+    seen = set()
+    pool = []
+    for name in names:
+        if name.isalpha() and name.lower() not in seen:
+            seen.add(name.lower())
+            pool.append(name)
+    return pool
+
+FIRST_NAMES = _name_pool(PersonProvider.first_names)
+LAST_NAMES = _name_pool(PersonProvider.last_names)
+EMAIL_DOMAINS = list(InternetProvider.free_email_domains)
+
+# Render q as bijective base-26 middle initials (0 -> none, 1 -> "A.", 27 -> "A. A.")
+def _middle_initials(q):
+    initials = []
+    while q > 0:
+        q, letter = divmod(q - 1, 26)
+        initials.append(string.ascii_uppercase[letter] + '.')
+    return initials[::-1]
+
+# Generate unique (full_name, email) pairs: each block q permutes all (first, last) pairs
+# and tags them with q as an email suffix and middle initials; same seed, same sequence
+def generate_unique_names(n, first_names=FIRST_NAMES, last_names=LAST_NAMES, seed=None):
+    rng = random.Random(seed)
+    pair_count = len(first_names) * len(last_names)
+
+    # Random multiplier coprime with pair_count keeps each block a permutation
+    multiplier = 1
+    if pair_count > 1:
+        multiplier = rng.randrange(1, pair_count)
+        while math.gcd(multiplier, pair_count) != 1:
+            multiplier = rng.randrange(1, pair_count)
+    offset = rng.randrange(pair_count)
+    stride = rng.randrange(pair_count)
+
+    for i in range(n):
+        q, r = divmod(i, pair_count)
+        j = (multiplier * r + offset + q * stride) % pair_count
+        first = first_names[j % len(first_names)]
+        last = last_names[j // len(first_names)]
+
+        # Names are alphabetic, so the numeric suffix can never merge into the last name
+        full_name = ' '.join([first] + _middle_initials(q) + [last])
+        email = f"{first.lower()}.{last.lower()}{q if q else ''}@{rng.choice(EMAIL_DOMAINS)}"
+        yield full_name, email
+
+def hash_value(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'little')
+
+# Check for duplicates via sorted 64-bit hashes (sorted in place), comparing exactly on collision
+def check_unique(hashes, values, label):
+    hashes.sort()
+    colliding = set(hashes[1:][hashes[1:] == hashes[:-1]].tolist())
+    if not colliding:
+        return
+
+    # Exact fallback for the (rare) hash collisions
+    seen = set()
+    for value in values:
+        if hash_value(value) in colliding:
+            if value in seen:
+                raise ValueError(f"Duplicate {label}: {value}")
+            seen.add(value)
+
+# Generate identities data in DataFrame chunks so large n never sits in memory at once
+def generate_identity_chunks(departments_df, n=200, chunk_size=100_000, check_emails=True):
     statuses = ['ACTIVE', 'TERMINATED', 'ON_LEAVE']
     status_weights = [0.85, 0.1, 0.05]  # 85% active
     teams = ['Frontend', 'Backend', 'DevOps', 'QA', 'UX', 'Sales', 'Marketing', 'Finance', 'HR']
     identity_types = ['EMPLOYEE', 'CONTRACTOR', 'VENDOR']
     identity_type_weights = [0.8, 0.15, 0.05]
+    department_ids = departments_df['id'].tolist()
+    seed = random.getrandbits(64)
+    names = generate_unique_names(n, seed=seed)
+    email_hashes = np.empty(n if check_emails else 0, dtype=np.uint64)
 
-    # First create some managers
-    manager_ids = []
-    for i in range(10):
+    # The first 10 identities are managers
+    manager_ids = list(range(1, min(10, n) + 1))
+    identities = []
+    for i in range(n):
         identity_id = i + 1
-        manager_ids.append(identity_id)
-        department = random.choice(departments_df['id'].tolist())
-        start_date = fake.date_between(start_date='-5y', end_date='-1y')
+        is_manager = identity_id in manager_ids
+        department = random.choice(department_ids)
+        full_name, email = next(names)
+        if check_emails:
+            email_hashes[i] = hash_value(email)
+        if is_manager:
+            start_date = fake.date_between(start_date='-5y', end_date='-1y')
+        else:
+            start_date = fake.date_between(start_date='-3y', end_date='-1m')
 
         identities.append({
             'id': identity_id,
-            'full_name_precomputed': fake.name(),
-            'email': fake.email(),
+            'full_name_precomputed': full_name,
+            'email': email,
             'team': random.choice(teams),
             'status': random.choices(statuses, weights=status_weights)[0],
             'department_id': department,
-            'manager_id': None,  # Top-level managers have no manager
+            'manager_id': None if is_manager else random.choice(manager_ids),  # Top-level managers have no manager
             'start_date': start_date,
             'end_date': None if random.random() < 0.95 else fake.date_between(start_date=start_date, end_date='today'),
             'identity_type': random.choices(identity_types, weights=identity_type_weights)[0]
         })
 
-    # Then create the rest of the identities
-    for i in range(10, n):
-        identity_id = i + 1
-        department = random.choice(departments_df['id'].tolist())
-        manager_id = random.choice(manager_ids)
-        start_date = fake.date_between(start_date='-3y', end_date='-1m')
+        if len(identities) == chunk_size:
+            yield pd.DataFrame(identities)
+            identities = []
 
-        identities.append({
-            'id': identity_id,
-            'full_name_precomputed': fake.name(),
-            'email': fake.email(),
-            'team': random.choice(teams),
-            'status': random.choices(statuses, weights=status_weights)[0],
-            'department_id': department,
-            'manager_id': manager_id,
-            'start_date': start_date,
-            'end_date': None if random.random() < 0.95 else fake.date_between(start_date=start_date, end_date='today'),
-            'identity_type': random.choices(identity_types, weights=identity_type_weights)[0]
-        })
+    if identities:
+        yield pd.DataFrame(identities)
+
+    # Defensive: emails are unique by construction; the fallback replays the seeded names
+    if check_emails:
+        check_unique(email_hashes, (email for _, email in generate_unique_names(n, seed=seed)), 'email')
 
-    return pd.DataFrame(identities)
+# Generate identities data (renamed from users)
+def generate_identities(departments_df, n=200):
+    chunks = list(generate_identity_chunks(departments_df, n))
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
 
 # Generate applications data
 def generate_applications(n=100):
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from generate_data import (
+    _middle_initials,
+    check_unique,
+    generate_departments,
+    generate_identities,
+    generate_identity_chunks,
+    generate_unique_names,
+    hash_value,
+)
+
+FIRST_NAMES = ['Ann', 'Bob', 'Cy']
+LAST_NAMES = ['Lee', 'Ng']
+PAIR_COUNT = len(FIRST_NAMES) * len(LAST_NAMES)
+
+
+def test_middle_initials():
+    assert _middle_initials(0) == []
+    assert _middle_initials(1) == ['A.']
+    assert _middle_initials(26) == ['Z.']
+    assert _middle_initials(27) == ['A.', 'A.']
+    assert _middle_initials(702) == ['Z.', 'Z.']
+    assert _middle_initials(703) == ['A.', 'A.', 'A.']
+
+
+# Covers the block boundaries at q=1, q=27 (two initials) and q=703 (three initials)
+@pytest.mark.parametrize('n', [0, 1, PAIR_COUNT - 1, PAIR_COUNT, PAIR_COUNT + 1,
+                               PAIR_COUNT * 27 + 1, PAIR_COUNT * 703 + 1])
+def test_generate_unique_names_is_unique(n):
+    rows = list(generate_unique_names(n, FIRST_NAMES, LAST_NAMES))
+    assert len(rows) == n
+    assert len({name for name, _ in rows}) == n
+    assert len({email.split('@')[0] for _, email in rows}) == n
+
+
+def test_generate_unique_names_plain_first_block():
+    rows = list(generate_unique_names(PAIR_COUNT + 1, FIRST_NAMES, LAST_NAMES))
+    assert all(len(name.split()) == 2 for name, _ in rows[:PAIR_COUNT])
+    assert all(not email.split('@')[0][-1].isdigit() for _, email in rows[:PAIR_COUNT])
+    assert len(rows[-1][0].split()) == 3
+    assert rows[-1][1].split('@')[0].endswith('1')
+
+
+def test_generate_unique_names_seed_replays():
+    assert list(generate_unique_names(50, seed=7)) == list(generate_unique_names(50, seed=7))
+
+
+def test_check_unique_passes_forced_collision_of_distinct_values():
+    check_unique(np.zeros(2, dtype=np.uint64), ['a', 'b'], 'value')
+
+
+def test_check_unique_raises_on_duplicate():
+    hashes = np.array([hash_value(v) for v in ['a', 'b', 'a']], dtype=np.uint64)
+    with pytest.raises(ValueError, match='Duplicate value: a'):
+        check_unique(hashes, ['a', 'b', 'a'], 'value')
+
+
+@pytest.mark.parametrize('n', [0, 1, 25])
+def test_generate_identities_sizes(n):
+    identities_df = generate_identities(generate_departments(), n)
+    assert len(identities_df) == n
+    if n:
+        assert identities_df['email'].is_unique
+        assert identities_df['id'].tolist() == list(range(1, n + 1))
+
+
+def test_generate_identity_chunks():
+    chunks = list(generate_identity_chunks(generate_departments(), 25, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[0]['manager_id'].isna().all()
+    assert chunks[1]['manager_id'].between(1, 10).all()